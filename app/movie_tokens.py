@@ -0,0 +1,19 @@
+"""Movie tokeniser shared by the app's similarity search and scripts/compute_similarity.py.
+
+A movie's token set is the lower-cased comma/pipe separated values of
+``TOKEN_FIELDS`` plus its release year. Both the on-the-fly scores in the app
+and the precomputed MovieSimilarity table read tokens from here, so they agree.
+"""
+from __future__ import annotations
+
+import re
+
+# Text fields whose comma/pipe separated values become similarity tokens.
+TOKEN_FIELDS = ("genre", "director", "actor_1", "actor_2", "actor_3", "language")
+
+
+def split_tokens(value: object) -> list[str]:
+    if value is None:
+        return []
+    tokens = re.split(r"[|,]", str(value))
+    return [token.strip().lower() for token in tokens if token and token.strip()]
@@ -0,0 +1,47 @@
+"""Compare benchmark medians across commits from a ``run_benchmarks.py`` results file."""
+from __future__ import annotations
+
+import argparse
+import pathlib
+
+import pandas as pd
+
+DEFAULT_RESULTS = pathlib.Path(__file__).resolve().parent / "results.jsonl"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Tabulate benchmark medians per commit.")
+    parser.add_argument("results", type=pathlib.Path, nargs="?", default=DEFAULT_RESULTS, help="JSONL results file.")
+    parser.add_argument("--metric", default="median_ms", choices=["min_ms", "median_ms", "p95_ms", "max_ms"])
+    parser.add_argument("--baseline", help="Commit to divide by; ratios above 1 are regressions.")
+    parser.add_argument("--dialect", help="Only runs against this dialect (mysql or sqlite).")
+    parser.add_argument("--movies", type=int, help="Only runs with this many movies loaded.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    runs = pd.read_json(args.results, lines=True)
+    if args.dialect:
+        runs = runs[runs["dialect"] == args.dialect]
+    if args.movies:
+        runs = runs[runs["movies"] == args.movies]
+    runs = runs.dropna(subset=[args.metric])
+    if runs.empty:
+        raise SystemExit("No matching results.")
+
+    # Latest run per commit/size wins when a commit was benchmarked more than once.
+    runs = runs.sort_values("timestamp").drop_duplicates(["commit", "dialect", "movies", "benchmark"], keep="last")
+    commits = runs.sort_values("timestamp")["commit"].unique()
+    table = runs.pivot_table(
+        index=["dialect", "movies", "benchmark"], columns="commit", values=args.metric, aggfunc="last"
+    )[commits]
+    if args.baseline:
+        if args.baseline not in table.columns:
+            raise SystemExit(f"Commit {args.baseline!r} not found; have {', '.join(commits)}")
+        table = table.div(table[args.baseline], axis=0)
+    print(table.round(3).to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+"""Generate synthetic movie and rating data shaped like ``data/indian movies.csv``.
+
+The movies CSV has the same header and quirks as the real dump: ``-``
+placeholders, ``"134 min"`` timings, thousands separators in vote counts and
+year values such as ``"2018 Video"``. Languages, genre mixes and rating/vote
+distributions follow the real file's proportions. Ratings follow power laws on
+both sides: a few users rate a lot and a few movies collect most ratings.
+
+Everything is written in fixed-size chunks, so 10M-movie files need no more
+memory than 100k-movie ones.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import pathlib
+
+import numpy as np
+import pandas as pd
+
+SIZE_PRESETS = {"100k": 100_000, "1m": 1_000_000, "10m": 10_000_000}
+CHUNK_ROWS = 100_000
+MOVIE_CSV_COLUMNS = ["ID", "Movie Name", "Year", "Timing(min)", "Rating(10)", "Votes", "Genre", "Language"]
+
+# Share of rows per language in the 46k-row source dataset.
+LANGUAGE_WEIGHTS = {
+    "hindi": 14350, "malayalam": 6200, "tamil": 6000, "telugu": 5300, "bengali": 4200,
+    "urdu": 3447, "kannada": 3233, "marathi": 2300, "punjabi": 1800, "nepali": 1000,
+    "oriya": 850, "gujarati": 700, "assamese": 500, "bhojpuri": 400, "konkani": 150,
+    "sindhi": 100, "sanskrit": 50, "tulu": 50, "english": 50,
+}
+GENRE_WEIGHTS = {
+    "Drama": 24758, "Action": 7781, "Romance": 6689, "Comedy": 6584, "Thriller": 4144,
+    "Crime": 2697, "Family": 2411, "Short": 1749, "Musical": 1579, "Adventure": 1329,
+    "Mystery": 1156, "Horror": 1105, "Fantasy": 1060, "History": 630, "Documentary": 602,
+    "Biography": 548, "Music": 476, "Animation": 294, "Sport": 188, "War": 187,
+    "Sci-Fi": 176, "Talk-Show": 65, "Reality-TV": 64, "News": 32,
+}
+# How many genres a movie lists (0 means the "-" placeholder).
+GENRE_COUNT_WEIGHTS = {0: 0.17, 1: 0.56, 2: 0.13, 3: 0.14}
+MISSING_TIMING_RATE = 0.51
+MISSING_RATING_RATE = 0.53
+ODD_YEAR_RATE = 0.05
+TITLE_VOCABULARY = 5_000
+REGIONS = ["Delhi", "Mumbai", "Chennai", "Kolkata", "Bengaluru", "Hyderabad", "Pune", "Jaipur"]
+AGE_GROUPS = ["18-24", "25-34", "35-44", "45-54", "55+"]
+
+
+def parse_size(value: str) -> int:
+    """``100k``/``1m``/``10m`` or a plain integer."""
+    preset = SIZE_PRESETS.get(value.lower())
+    return preset if preset is not None else int(value.replace("_", ""))
+
+
+def _weighted(rng: np.random.Generator, weights: dict, size: int) -> np.ndarray:
+    keys = np.array(list(weights.keys()), dtype=object)
+    probabilities = np.array(list(weights.values()), dtype=float)
+    return keys[rng.choice(len(keys), size=size, p=probabilities / probabilities.sum())]
+
+
+def _title_words(rng: np.random.Generator) -> np.ndarray:
+    """Pronounceable pseudo-words; titles draw from them with Zipf frequencies."""
+    consonants = list("bdghjklmnprstvy") + ["ch", "sh", "kh", "bh", "dh"]
+    vowels = ["a", "aa", "e", "i", "ee", "o", "u", "ai"]
+    syllables = np.array([c + v for c in consonants for v in vowels], dtype=object)
+    lengths = rng.integers(2, 4, size=TITLE_VOCABULARY)
+    words = ["".join(rng.choice(syllables, size=length)).capitalize() for length in lengths]
+    return np.array(words, dtype=object)
+
+
+def power_law_ranks(rng: np.random.Generator, population: int, size: int, exponent: float) -> np.ndarray:
+    """``size`` draws from ``1..population`` with ``P(k)`` proportional to ``k ** -exponent``, zero-based."""
+    cdf = np.cumsum(np.arange(1, population + 1, dtype=float) ** -exponent)
+    cdf /= cdf[-1]
+    return np.minimum(np.searchsorted(cdf, rng.random(size)), population - 1)
+
+
+def _movie_chunk(rng: np.random.Generator, start: int, rows: int, words: np.ndarray) -> pd.DataFrame:
+    word_ranks = power_law_ranks(rng, len(words), rows * 3, 1.1).reshape(rows, 3)
+    title_lengths = rng.integers(1, 4, size=rows)
+    picked = words[word_ranks]
+    titles = np.where(
+        title_lengths == 1, picked[:, 0],
+        np.where(title_lengths == 2, picked[:, 0] + " " + picked[:, 1],
+                 picked[:, 0] + " " + picked[:, 1] + " " + picked[:, 2]),
+    )
+
+    years = rng.integers(1931, 2024, size=rows).astype(str).astype(object)
+    odd_years = rng.random(rows) < ODD_YEAR_RATE
+    years[odd_years] = np.where(rng.random(odd_years.sum()) < 0.5, years[odd_years] + " Video", "II " + years[odd_years])
+
+    timings = (rng.normal(130, 25, size=rows).clip(40, 240).astype(int)).astype(str).astype(object) + " min"
+    timings[rng.random(rows) < MISSING_TIMING_RATE] = "-"
+
+    rated = rng.random(rows) >= MISSING_RATING_RATE
+    ratings = np.full(rows, "-", dtype=object)
+    ratings[rated] = np.char.mod("%.1f", rng.normal(6.3, 1.45, size=rated.sum()).clip(1, 10).round(1))
+    votes = np.full(rows, "-", dtype=object)
+    # Log-normal with the real file's median (~42) and heavy tail.
+    vote_values = np.exp(rng.normal(3.75, 1.9, size=rated.sum())).clip(5, 1_000_000).astype(np.int64)
+    votes[rated] = [f"{value:,}" for value in vote_values]
+
+    genre_counts = _weighted(rng, GENRE_COUNT_WEIGHTS, rows).astype(int)
+    genre_draws = _weighted(rng, GENRE_WEIGHTS, rows * 3).reshape(rows, 3)
+    genres = np.array(
+        [", ".join(dict.fromkeys(draw[:count])) if count else "-" for draw, count in zip(genre_draws, genre_counts)],
+        dtype=object,
+    )
+
+    return pd.DataFrame({
+        "ID": [f"tt{9_000_000 + start + offset:08d}" for offset in range(rows)],
+        "Movie Name": titles,
+        "Year": years,
+        "Timing(min)": timings,
+        "Rating(10)": ratings,
+        "Votes": votes,
+        "Genre": genres,
+        "Language": _weighted(rng, LANGUAGE_WEIGHTS, rows),
+    }, columns=MOVIE_CSV_COLUMNS)
+
+
+def write_movies_csv(path: pathlib.Path, movies: int, seed: int = 7) -> pathlib.Path:
+    """Write ``movies`` synthetic rows to ``path`` in the source CSV format."""
+    rng = np.random.default_rng(seed)
+    words = _title_words(rng)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", newline="", encoding="utf-8") as handle:
+        for start in range(0, movies, CHUNK_ROWS):
+            chunk = _movie_chunk(rng, start, min(CHUNK_ROWS, movies - start), words)
+            chunk.to_csv(handle, header=start == 0, index=False, quoting=csv.QUOTE_MINIMAL)
+    return path
+
+
+def users_frame(users: int, seed: int = 11) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "user_id": np.arange(1, users + 1),
+        "name": [f"Bench User {user_id}" for user_id in range(1, users + 1)],
+        "region": rng.choice(REGIONS, size=users),
+        "age_group": rng.choice(AGE_GROUPS, size=users),
+    })
+
+
+def ratings_frame(ratings: int, users: int, movie_ids: np.ndarray, seed: int = 13) -> pd.DataFrame:
+    """Power-law ``(user_id, movie_id, rating)`` triples, one rating per user/movie pair.
+
+    Duplicated pairs are dropped, so slightly fewer than ``ratings`` rows can come back.
+    """
+    rng = np.random.default_rng(seed)
+    user_rank = power_law_ranks(rng, users, ratings, 1.05)
+    movie_rank = power_law_ranks(rng, len(movie_ids), ratings, 0.9)
+    # Shuffle rank -> id so popularity is not correlated with insertion order.
+    user_ids = rng.permutation(users)[user_rank] + 1
+    movie_ids = rng.permutation(movie_ids)[movie_rank]
+    pairs = pd.DataFrame({"user_id": user_ids, "movie_id": movie_ids}).drop_duplicates(ignore_index=True)
+    pairs["rating"] = rng.integers(2, 21, size=len(pairs)) / 2
+    return pairs
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Write a synthetic movies CSV in the source dataset's format.")
+    parser.add_argument("--movies", default="100k", help="Row count or preset: 100k, 1m, 10m.")
+    parser.add_argument("--output", type=pathlib.Path, required=True, help="CSV path to write.")
+    parser.add_argument("--seed", type=int, default=7)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    path = write_movies_csv(args.output, parse_size(args.movies), args.seed)
+    print(f"Wrote {parse_size(args.movies):,} movies to {path}")
+
+
+if __name__ == "__main__":
+    main()
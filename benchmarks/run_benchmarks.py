@@ -0,0 +1,413 @@
+"""Time the loader, search queries and recommenders on synthetic data.
+
+Generates a movies CSV (see ``generate_data.py``) plus power-law users and
+ratings, loads them, then times the search page's SQL and every recommender
+in ``app/streamlit_app.py`` against the loaded database. One JSON line per
+benchmark is appended to ``--output`` together with the git commit, so runs
+from different commits can be compared with ``compare_results.py``.
+
+MySQL is the real target: point ``--db-url`` at a scratch database created from
+``sql/bollywoodlens_schema.sql``. Without ``--db-url`` a SQLite file stands in.
+It uses a portable copy of the schema and a plain-INSERT load path, and it skips
+FULLTEXT title searches, which need MySQL.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import pathlib
+import platform
+import subprocess
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    Numeric,
+    String,
+    Table,
+    TIMESTAMP,
+    BigInteger,
+    Index,
+    Text,
+    create_engine,
+    func,
+    text,
+)
+from sqlalchemy.engine import Engine
+
+BENCH_DIR = pathlib.Path(__file__).resolve().parent
+REPO_ROOT = BENCH_DIR.parent
+sys.path[:0] = [str(BENCH_DIR), str(REPO_ROOT / "scripts"), str(REPO_ROOT / "app")]
+
+import generate_data  # noqa: E402
+import load_movies as loader  # noqa: E402
+
+DEFAULT_DATA_DIR = BENCH_DIR / ".data"
+DEFAULT_OUTPUT = BENCH_DIR / "results.jsonl"
+LOAD_CHUNK_SIZE = 5_000
+SEARCH_CASES = {
+    "search: no filters": {},
+    "search: language": {"language": "Hindi"},
+    "search: rating + year": {"min_rating": 7.0, "year": 2010},
+    "search: genre": {"genre": "Drama"},
+    "search: short title (LIKE)": {"title": "Ka"},
+}
+FULLTEXT_SEARCH_CASES = {
+    "search: title term (FULLTEXT)": {"title": None},  # filled with a common title word
+}
+DEEP_PAGES = 10
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    timings: list[float] = field(default_factory=list)
+    rows: Optional[int] = None
+    note: str = ""
+
+    def to_record(self) -> dict[str, object]:
+        record: dict[str, object] = {"benchmark": self.name, "calls": len(self.timings), "rows": self.rows}
+        if self.timings:
+            millis = np.array(self.timings) * 1000
+            record.update({
+                "min_ms": round(float(millis.min()), 3),
+                "median_ms": round(float(np.median(millis)), 3),
+                "p95_ms": round(float(np.percentile(millis, 95)), 3),
+                "max_ms": round(float(millis.max()), 3),
+            })
+        if self.note:
+            record["note"] = self.note
+        return record
+
+
+def time_calls(name: str, call: Callable[[], object], repeat: int, setup: Optional[Callable[[], None]] = None) -> BenchmarkResult:
+    """Run ``call`` ``repeat`` times; ``setup`` runs untimed before each call."""
+    result = BenchmarkResult(name)
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        value = call()
+        result.timings.append(time.perf_counter() - started)
+        if isinstance(value, pd.DataFrame):
+            result.rows = len(value)
+    return result
+
+
+def portable_schema() -> MetaData:
+    """The tables and indexes the app queries, minus MySQL-only features."""
+    metadata = MetaData()
+    movies = Table(
+        "Movies", metadata,
+        Column("movie_id", Integer, primary_key=True),
+        Column("imdb_id", String(12), nullable=False, unique=True),
+        Column("title", String(255), nullable=False),
+        Column("genre", String(255)),
+        Column("language", String(100)),
+        Column("release_year", Integer),
+        Column("duration_minutes", Integer),
+        Column("director", String(255)),
+        Column("actors", Text),
+        Column("imdb_rating", Numeric(3, 1)),
+        Column("votes", Integer),
+        Column("content_hash", BigInteger),
+        Column("created_at", TIMESTAMP, server_default=func.current_timestamp()),
+        Column("updated_at", TIMESTAMP, server_default=func.current_timestamp()),
+    )
+    Index("idx_movies_rating", movies.c.imdb_rating)
+    Index("idx_movies_language", movies.c.language)
+    Index("idx_movies_year", movies.c.release_year)
+    Index("idx_movies_updated_at", movies.c.updated_at)
+    Table(
+        "Users", metadata,
+        Column("user_id", Integer, primary_key=True),
+        Column("name", String(100), nullable=False),
+        Column("region", String(100)),
+        Column("age_group", String(50)),
+    )
+    ratings = Table(
+        "Ratings", metadata,
+        Column("rating_id", Integer, primary_key=True),
+        Column("user_id", Integer, nullable=False),
+        Column("movie_id", Integer, nullable=False),
+        Column("rating", Numeric(3, 1), nullable=False),
+        Column("rated_at", TIMESTAMP, server_default=func.current_timestamp()),
+    )
+    Index("idx_ratings_user", ratings.c.user_id)
+    Index("idx_ratings_movie", ratings.c.movie_id)
+    Index("idx_ratings_rated_at", ratings.c.rated_at)
+    Table(
+        "Genres", metadata,
+        Column("genre_id", Integer, primary_key=True),
+        Column("name", String(100), nullable=False, unique=True),
+    )
+    movie_genres = Table(
+        "MovieGenres", metadata,
+        Column("genre_id", Integer, primary_key=True),
+        Column("movie_id", Integer, primary_key=True),
+    )
+    Index("idx_moviegenres_movie", movie_genres.c.movie_id)
+    return metadata
+
+
+def _is_sqlite(engine: Engine) -> bool:
+    return engine.dialect.name == "sqlite"
+
+
+def prepare_database(engine: Engine, reset: bool) -> None:
+    if _is_sqlite(engine):
+        portable_schema().create_all(engine)
+        return
+    with engine.begin() as conn:
+        existing = conn.execute(text("SELECT COUNT(*) FROM Movies")).scalar()
+        if existing and not reset:
+            raise SystemExit(
+                f"Movies already holds {existing:,} rows; rerun with --reset-database on a scratch database "
+                "or --skip-load to benchmark what is there."
+            )
+        for table in ("Ratings", "MovieGenres", "Genres", "Movies", "Users"):
+            conn.execute(text(f"DELETE FROM {table}"))
+
+
+def _load_sqlite(engine: Engine, csv_path: pathlib.Path) -> int:
+    """Loader cleaning plus plain INSERTs, since the upsert path is MySQL-only."""
+    genre_ids: dict[str, int] = {}
+    next_movie_id = 1
+    with engine.begin() as conn:
+        for chunk in loader.iter_csv_chunks(csv_path, LOAD_CHUNK_SIZE):
+            chunk = chunk.assign(movie_id=np.arange(next_movie_id, next_movie_id + len(chunk)))
+            next_movie_id += len(chunk)
+            chunk.to_sql("Movies", conn, if_exists="append", index=False)
+            pairs = loader._genre_pairs(chunk).merge(chunk[["imdb_id", "movie_id"]], on="imdb_id")
+            new_names = [name for name in pairs["name"].unique() if name not in genre_ids]
+            if new_names:
+                start = len(genre_ids) + 1
+                genre_ids.update({name: start + offset for offset, name in enumerate(new_names)})
+                pd.DataFrame({"genre_id": range(start, start + len(new_names)), "name": new_names}).to_sql(
+                    "Genres", conn, if_exists="append", index=False
+                )
+            pd.DataFrame({
+                "genre_id": pairs["name"].map(genre_ids).to_numpy(),
+                "movie_id": pairs["movie_id"].to_numpy(),
+            }).to_sql("MovieGenres", conn, if_exists="append", index=False)
+    return next_movie_id - 1
+
+
+def load_catalog(engine: Engine, db_url: str, csv_path: pathlib.Path) -> BenchmarkResult:
+    started = time.perf_counter()
+    if _is_sqlite(engine):
+        rows = _load_sqlite(engine, csv_path)
+        note = "SQLite stand-in: loader cleaning + plain INSERT"
+    else:
+        report = loader.load_movies(csv_path, db_url, chunk_size=LOAD_CHUNK_SIZE, stream=True)
+        rows = report.rows_read
+        note = f"{report.rows_per_second:,.0f} rows/s"
+    return BenchmarkResult("load_movies", [time.perf_counter() - started], rows, note)
+
+
+def load_ratings(engine: Engine, users: int, ratings: int, seed: int) -> BenchmarkResult:
+    with engine.connect() as conn:
+        movie_ids = pd.read_sql(text("SELECT movie_id FROM Movies"), conn)["movie_id"].to_numpy()
+    started = time.perf_counter()
+    ratings_df = generate_data.ratings_frame(ratings, users, movie_ids, seed)
+    with engine.begin() as conn:
+        generate_data.users_frame(users, seed).to_sql("Users", conn, if_exists="append", index=False, chunksize=10_000)
+        ratings_df.to_sql("Ratings", conn, if_exists="append", index=False, chunksize=10_000, method="multi")
+    return BenchmarkResult("load ratings", [time.perf_counter() - started], len(ratings_df))
+
+
+def import_app(db_url: str):
+    """Import the Streamlit app bound to ``db_url`` (bare mode, warnings muted)."""
+    os.environ["BOLLYWOODLENS_DB_URL"] = db_url
+    logging.disable(logging.WARNING)
+    import streamlit_app
+
+    return streamlit_app
+
+
+def _common_title_word(engine: Engine) -> str:
+    with engine.connect() as conn:
+        titles = pd.read_sql(text("SELECT title FROM Movies LIMIT 5000"), conn)["title"]
+    words = titles.str.split().explode()
+    words = words[words.str.len() >= 4]
+    return words.value_counts().index[0] if not words.empty else "Love"
+
+
+def bench_search(app, engine: Engine, repeat: int) -> list[BenchmarkResult]:
+    results = []
+    cases = dict(SEARCH_CASES)
+    if _is_sqlite(engine):
+        results.extend(
+            BenchmarkResult(name, note="skipped: FULLTEXT needs MySQL") for name in FULLTEXT_SEARCH_CASES
+        )
+    else:
+        cases.update({name: {"title": _common_title_word(engine)} for name in FULLTEXT_SEARCH_CASES})
+    for name, filters in cases.items():
+        results.append(time_calls(name, lambda: app.fetch_search_page(engine, filters)[0], repeat))
+
+    def walk_pages():
+        cursor = None
+        for _ in range(DEEP_PAGES):
+            page, has_next, cursor = app.fetch_search_page(engine, {}, cursor)
+            if not has_next:
+                break
+        return page
+
+    results.append(time_calls(f"search: {DEEP_PAGES} pages deep", walk_pages, repeat))
+    results.append(time_calls(
+        "search: exact count", lambda: app.count_search_results({}, exact=True), repeat,
+        setup=app.count_search_results.clear,
+    ))
+    if _is_sqlite(engine):
+        results.append(BenchmarkResult("search: estimated count", note="skipped: EXPLAIN estimate needs MySQL"))
+    else:
+        results.append(time_calls(
+            "search: estimated count", lambda: app.count_search_results({}, exact=False), repeat,
+            setup=app.count_search_results.clear,
+        ))
+    return results
+
+
+def bench_recommenders(app, engine: Engine, repeat: int, seed: int) -> list[BenchmarkResult]:
+    rng = np.random.default_rng(seed)
+    results = [time_calls("catalog build", app.load_movie_catalog, 1, setup=app._load_movie_catalog.clear)]
+    catalog = app.load_movie_catalog()
+    frame = catalog.frame
+
+    movie_ids = iter(rng.choice(frame["movie_id"].to_numpy(), size=repeat))
+    results.append(time_calls("get_similar_movies", lambda: app.get_similar_movies(catalog, int(next(movie_ids)), 10), repeat))
+    results.append(time_calls("rank_popular_movies", lambda: app.rank_popular_movies(frame, 1000, 10), repeat))
+    results.append(time_calls(
+        "recommend_movies_by_genre",
+        lambda: app.recommend_movies_by_genre(frame, "Drama", 7.0, 10),
+        repeat,
+        setup=app._fetch_genre_movie_ids.clear,
+    ))
+
+    with engine.connect() as conn:
+        activity = pd.read_sql(
+            text("SELECT user_id, COUNT(*) AS ratings FROM Ratings GROUP BY user_id ORDER BY ratings DESC"), conn
+        )
+    if activity.empty:
+        return results + [BenchmarkResult("recommend_for_user", note="skipped: no ratings loaded")]
+    cohorts = {
+        "power user": activity.iloc[0],
+        "median user": activity.iloc[len(activity) // 2],
+    }
+    for label, user in cohorts.items():
+        user_id = int(user["user_id"])
+
+        def personalise(user_id=user_id):
+            preferences = app.load_user_preference_summary(user_id)
+            return app.recommend_for_user(user_id, frame, preferences, 10)
+
+        result = time_calls(f"recommend_for_user ({label})", personalise, repeat)
+        result.note = f"{int(user['ratings']):,} ratings"
+        results.append(result)
+    return results
+
+
+def git_commit() -> str:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"], cwd=REPO_ROOT, capture_output=True, text=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{commit}-dirty" if dirty else commit
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the loader, search and recommenders on synthetic data.")
+    parser.add_argument("--movies", default="100k", help="Movies to generate: 100k, 1m, 10m or a row count.")
+    parser.add_argument("--ratings", default=None, help="Ratings to generate (default: 2 per movie).")
+    parser.add_argument("--users", type=int, default=None, help="Users to generate (default: ratings / 50).")
+    parser.add_argument(
+        "--db-url",
+        default=None,
+        help="SQLAlchemy URL of a scratch MySQL database; defaults to a SQLite file under benchmarks/.data.",
+    )
+    parser.add_argument("--data-dir", type=pathlib.Path, default=DEFAULT_DATA_DIR, help="Where generated files go.")
+    parser.add_argument("--output", type=pathlib.Path, default=DEFAULT_OUTPUT, help="JSONL file results are appended to.")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed calls per query/recommender benchmark.")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--skip-load", action="store_true", help="Benchmark the data already in --db-url.")
+    parser.add_argument(
+        "--reset-database",
+        action="store_true",
+        help="Delete all Movies/Ratings/Users/Genres rows in the MySQL target before loading.",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    movies = generate_data.parse_size(args.movies)
+    ratings = generate_data.parse_size(args.ratings) if args.ratings else movies * 2
+    users = args.users or max(ratings // 50, 100)
+    args.data_dir.mkdir(parents=True, exist_ok=True)
+
+    db_url = args.db_url
+    if db_url is None:
+        sqlite_path = args.data_dir / f"bench-{movies}.db"
+        if not args.skip_load and sqlite_path.exists():
+            sqlite_path.unlink()
+        db_url = f"sqlite:///{sqlite_path}"
+    engine = create_engine(db_url)
+
+    results: list[BenchmarkResult] = []
+    if not args.skip_load:
+        prepare_database(engine, args.reset_database)
+        csv_path = args.data_dir / f"movies-{movies}.csv"
+        if not csv_path.exists():
+            print(f"Generating {movies:,} movies -> {csv_path}")
+            generate_data.write_movies_csv(csv_path, movies, args.seed)
+        print("Loading movies...")
+        results.append(load_catalog(engine, db_url, csv_path))
+        print("Loading users and ratings...")
+        results.append(load_ratings(engine, users, ratings, args.seed))
+
+    app = import_app(db_url)
+    print("Timing search queries...")
+    results.extend(bench_search(app, app.engine, args.repeat))
+    print("Timing recommenders...")
+    results.extend(bench_recommenders(app, app.engine, args.repeat, args.seed))
+
+    with app.engine.connect() as conn:
+        loaded_movies = conn.execute(text("SELECT COUNT(*) FROM Movies")).scalar()
+        loaded_ratings = conn.execute(text("SELECT COUNT(*) FROM Ratings")).scalar()
+    run = {
+        "run_id": uuid.uuid4().hex[:12],
+        "commit": git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "dialect": engine.dialect.name,
+        "movies": loaded_movies,
+        "ratings": loaded_ratings,
+        "python": platform.python_version(),
+    }
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with args.output.open("a", encoding="utf-8") as handle:
+        for result in results:
+            handle.write(json.dumps({**run, **result.to_record()}) + "\n")
+
+    table = pd.DataFrame([result.to_record() for result in results]).set_index("benchmark")
+    print(table.to_string())
+    print(f"\nAppended {len(results)} results for commit {run['commit']} to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -138,6 +138,7 @@ CREATE PROCEDURE AddMovie(
     IN p_votes INT
 )
 BEGIN
+    DECLARE v_movie_id INT;
     DECLARE EXIT HANDLER FOR SQLEXCEPTION
     BEGIN
         ROLLBACK;
@@ -160,8 +161,11 @@ BEGIN
         p_duration_minutes, p_director, p_actors, p_imdb_rating, p_votes
     );
     
+    SET v_movie_id = LAST_INSERT_ID();
+    CALL SyncMovieGenres(v_movie_id);
+    
     COMMIT;
-    SELECT LAST_INSERT_ID() AS movie_id, 'Movie added successfully' AS message;
+    SELECT v_movie_id AS movie_id, 'Movie added successfully' AS message;
 END //
 
 DELIMITER ;
@@ -18,9 +18,16 @@ CREATE TABLE Movies (
     actors TEXT,
     imdb_rating DECIMAL(3,1),
     votes INT,
+    content_hash BIGINT,  -- loader fingerprint used by delta loads
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-    CHECK (imdb_rating IS NULL OR (imdb_rating >= 0 AND imdb_rating <= 10))
+    CHECK (imdb_rating IS NULL OR (imdb_rating >= 0 AND imdb_rating <= 10)),
+    -- Serves MAX(updated_at) in the app's cache-version probe with one index read.
+    KEY idx_movies_updated_at (updated_at),
+    -- One FULLTEXT index per searchable column so each MATCH() can use its own.
+    FULLTEXT INDEX ft_movies_title (title),
+    FULLTEXT INDEX ft_movies_director (director),
+    FULLTEXT INDEX ft_movies_actors (actors)
 );
 
 CREATE TABLE Users (
@@ -37,6 +44,8 @@ CREATE TABLE Ratings (
     movie_id INT NOT NULL,
     rating DECIMAL(3,1) NOT NULL,
     rated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    -- Serves MAX(rated_at) in the app's data-version probe with one index read.
+    KEY idx_ratings_rated_at (rated_at),
     CONSTRAINT fk_ratings_user FOREIGN KEY (user_id)
         REFERENCES Users(user_id) ON DELETE CASCADE,
     CONSTRAINT fk_ratings_movie FOREIGN KEY (movie_id)
@@ -44,6 +53,36 @@ CREATE TABLE Ratings (
     CHECK (rating >= 0 AND rating <= 10)
 );
 
+-- Genre dimension: one row per distinct genre, linked to Movies through an
+-- indexed junction so genre filters are index lookups instead of LIKE scans.
+CREATE TABLE Genres (
+    genre_id INT AUTO_INCREMENT PRIMARY KEY,
+    name VARCHAR(100) NOT NULL UNIQUE
+);
+
+CREATE TABLE MovieGenres (
+    genre_id INT NOT NULL,
+    movie_id INT NOT NULL,
+    PRIMARY KEY (genre_id, movie_id),
+    KEY idx_moviegenres_movie (movie_id),
+    CONSTRAINT fk_moviegenres_genre FOREIGN KEY (genre_id)
+        REFERENCES Genres(genre_id) ON DELETE CASCADE,
+    CONSTRAINT fk_moviegenres_movie FOREIGN KEY (movie_id)
+        REFERENCES Movies(movie_id) ON DELETE CASCADE
+);
+
+-- Precomputed "similar movies" lists written by scripts/compute_similarity.py.
+-- Clustered on (movie_id, neighbor_rank) so a movie's neighbours are one range
+-- read in rank order. No foreign keys: the job rebuilds the table and swaps it
+-- in with RENAME TABLE, and readers join back to Movies anyway.
+CREATE TABLE MovieSimilarity (
+    movie_id INT NOT NULL,
+    neighbor_rank SMALLINT NOT NULL,
+    neighbor_id INT NOT NULL,
+    score FLOAT NOT NULL,
+    PRIMARY KEY (movie_id, neighbor_rank)
+);
+
 -- Sample seed data for Users table to support demo operations --------------
 INSERT INTO Users (name, region, age_group) VALUES
 ('Aarav Sharma', 'Delhi', '18-24'),
@@ -68,13 +107,66 @@ DROP PROCEDURE IF EXISTS GetMoviesByGenre //
 CREATE PROCEDURE GetMoviesByGenre(IN genre_query VARCHAR(100))
 BEGIN
     SELECT
-        title,
-        release_year,
-        imdb_rating,
-        language
+        m.title,
+        m.release_year,
+        m.imdb_rating,
+        m.language
+    FROM Genres g
+    JOIN MovieGenres mg ON mg.genre_id = g.genre_id
+    JOIN Movies m ON m.movie_id = mg.movie_id
+    WHERE g.name = TRIM(genre_query)
+    ORDER BY m.imdb_rating DESC, m.release_year DESC;
+END //
+
+-- Genre names are stored title-cased ("Drama", "Sci-Fi") exactly as Python's
+-- str.title() does in the loader and the app: a letter is upper-cased when it
+-- does not follow another letter, lower-cased otherwise.
+DROP FUNCTION IF EXISTS GenreTitleCase //
+CREATE FUNCTION GenreTitleCase(p_name VARCHAR(100)) RETURNS VARCHAR(100)
+DETERMINISTIC NO SQL
+BEGIN
+    DECLARE v_result VARCHAR(100) DEFAULT '';
+    DECLARE v_char VARCHAR(1);
+    DECLARE v_after_letter BOOLEAN DEFAULT FALSE;
+    DECLARE v_pos INT DEFAULT 1;
+
+    WHILE v_pos <= CHAR_LENGTH(p_name) DO
+        SET v_char = SUBSTRING(p_name, v_pos, 1);
+        SET v_result = CONCAT(v_result, IF(v_after_letter, LOWER(v_char), UPPER(v_char)));
+        SET v_after_letter = v_char REGEXP '^[[:alpha:]]$';
+        SET v_pos = v_pos + 1;
+    END WHILE;
+    RETURN v_result;
+END //
+
+-- Rebuild one movie's MovieGenres rows from its comma/pipe separated genre text.
+-- The bulk loader does the same split set-based; this covers single inserts.
+DROP PROCEDURE IF EXISTS SyncMovieGenres //
+CREATE PROCEDURE SyncMovieGenres(IN p_movie_id INT)
+BEGIN
+    DECLARE v_rest VARCHAR(255);
+    DECLARE v_token VARCHAR(100);
+
+    SELECT REPLACE(COALESCE(genre, ''), '|', ',') INTO v_rest
     FROM Movies
-    WHERE genre LIKE CONCAT('%', genre_query, '%')
-    ORDER BY imdb_rating DESC, release_year DESC;
+    WHERE movie_id = p_movie_id;
+
+    DELETE FROM MovieGenres WHERE movie_id = p_movie_id;
+
+    WHILE v_rest IS NOT NULL AND v_rest <> '' DO
+        SET v_token = GenreTitleCase(TRIM(SUBSTRING_INDEX(v_rest, ',', 1)));
+        IF LOCATE(',', v_rest) > 0 THEN
+            SET v_rest = SUBSTRING(v_rest, LOCATE(',', v_rest) + 1);
+        ELSE
+            SET v_rest = '';
+        END IF;
+
+        IF v_token <> '' AND v_token <> '-' THEN
+            INSERT IGNORE INTO Genres (name) VALUES (v_token);
+            INSERT IGNORE INTO MovieGenres (genre_id, movie_id)
+            SELECT genre_id, p_movie_id FROM Genres WHERE name = v_token;
+        END IF;
+    END WHILE;
 END //
 
 DROP TRIGGER IF EXISTS BeforeRatingInsert //
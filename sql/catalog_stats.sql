@@ -0,0 +1,171 @@
+-- Trigger-maintained dashboard counters for BollywoodLens
+-- Run this AFTER bollywoodlens_schema.sql (safe to re-run; it rebuilds the counts).
+
+USE BollywoodLens;
+
+-- Totals read by the Streamlit home page instead of COUNT(*)/AVG() scans. The
+-- average IMDb rating is kept as a running sum and count of non-NULL ratings so
+-- every trigger is a constant-time adjustment. The totals are split over 16
+-- shard rows and each connection only adjusts its own (CatalogStatsShard()),
+-- so concurrent loader workers, queue flushes and interactive saves do not
+-- queue up behind one row lock; readers SUM the shards.
+CREATE TABLE IF NOT EXISTS CatalogStats (
+    stat_id TINYINT PRIMARY KEY,
+    movie_count BIGINT NOT NULL DEFAULT 0,
+    rating_count BIGINT NOT NULL DEFAULT 0,
+    imdb_rating_sum DECIMAL(14,1) NOT NULL DEFAULT 0,
+    imdb_rating_count BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    CHECK (stat_id BETWEEN 1 AND 16)
+);
+
+-- Per-user rating counts ("My Ratings"); rows appear on a user's first rating.
+CREATE TABLE IF NOT EXISTS UserRatingStats (
+    user_id INT PRIMARY KEY,
+    rating_count BIGINT NOT NULL DEFAULT 0,
+    CONSTRAINT fk_userratingstats_user FOREIGN KEY (user_id)
+        REFERENCES Users(user_id) ON DELETE CASCADE
+);
+
+-- Earlier versions kept a single row with CHECK (stat_id = 1); widen it in place.
+SET @old_check = (
+    SELECT CONSTRAINT_NAME FROM information_schema.CHECK_CONSTRAINTS
+    WHERE CONSTRAINT_SCHEMA = DATABASE() AND CHECK_CLAUSE LIKE '%`stat_id` = 1%'
+    LIMIT 1
+);
+SET @drop_check = IF(@old_check IS NULL, 'DO 0',
+    CONCAT('ALTER TABLE CatalogStats DROP CHECK `', @old_check, '`, ADD CHECK (stat_id BETWEEN 1 AND 16)'));
+PREPARE drop_check FROM @drop_check;
+EXECUTE drop_check;
+DEALLOCATE PREPARE drop_check;
+
+DELIMITER //
+
+-- The CatalogStats row this connection's triggers adjust. Keep the modulus in
+-- step with the CHECK above and the shard seeding in RefreshCatalogStats.
+-- Triggers copy it into a local first so the UPDATE is a primary-key lookup.
+DROP FUNCTION IF EXISTS CatalogStatsShard //
+CREATE FUNCTION CatalogStatsShard() RETURNS TINYINT
+NOT DETERMINISTIC NO SQL
+BEGIN
+    RETURN 1 + CONNECTION_ID() % 16;
+END //
+
+-- Recompute every counter from the base tables (initial fill or drift repair).
+-- The totals land on shard 1 and the other shards restart from zero.
+DROP PROCEDURE IF EXISTS RefreshCatalogStats //
+CREATE PROCEDURE RefreshCatalogStats()
+BEGIN
+    START TRANSACTION;
+    DELETE FROM CatalogStats;
+    INSERT INTO CatalogStats (stat_id, movie_count, rating_count, imdb_rating_sum, imdb_rating_count)
+    SELECT 1,
+           (SELECT COUNT(*) FROM Movies),
+           (SELECT COUNT(*) FROM Ratings),
+           (SELECT IFNULL(SUM(imdb_rating), 0) FROM Movies),
+           (SELECT COUNT(imdb_rating) FROM Movies);
+    INSERT INTO CatalogStats (stat_id)
+    WITH RECURSIVE shards (n) AS (SELECT 2 UNION ALL SELECT n + 1 FROM shards WHERE n < 16)
+    SELECT n FROM shards;
+    DELETE FROM UserRatingStats;
+    INSERT INTO UserRatingStats (user_id, rating_count)
+    SELECT user_id, COUNT(*) FROM Ratings GROUP BY user_id;
+    COMMIT;
+END //
+
+DROP TRIGGER IF EXISTS AfterMovieInsertStats //
+CREATE TRIGGER AfterMovieInsertStats
+AFTER INSERT ON Movies
+FOR EACH ROW
+BEGIN
+    DECLARE v_shard TINYINT DEFAULT CatalogStatsShard();
+    UPDATE CatalogStats
+    SET movie_count = movie_count + 1,
+        imdb_rating_sum = imdb_rating_sum + IFNULL(NEW.imdb_rating, 0),
+        imdb_rating_count = imdb_rating_count + (NEW.imdb_rating IS NOT NULL)
+    WHERE stat_id = v_shard;
+END //
+
+DROP TRIGGER IF EXISTS AfterMovieUpdateStats //
+CREATE TRIGGER AfterMovieUpdateStats
+AFTER UPDATE ON Movies
+FOR EACH ROW
+BEGIN
+    DECLARE v_shard TINYINT DEFAULT CatalogStatsShard();
+    IF NOT (NEW.imdb_rating <=> OLD.imdb_rating) THEN
+        UPDATE CatalogStats
+        SET imdb_rating_sum = imdb_rating_sum + IFNULL(NEW.imdb_rating, 0) - IFNULL(OLD.imdb_rating, 0),
+            imdb_rating_count = imdb_rating_count + (NEW.imdb_rating IS NOT NULL) - (OLD.imdb_rating IS NOT NULL)
+        WHERE stat_id = v_shard;
+    END IF;
+END //
+
+-- Foreign-key cascades do not fire triggers, so the ratings a movie deletion
+-- is about to cascade away are subtracted here while they still exist.
+DROP TRIGGER IF EXISTS BeforeMovieDeleteStats //
+CREATE TRIGGER BeforeMovieDeleteStats
+BEFORE DELETE ON Movies
+FOR EACH ROW
+BEGIN
+    DECLARE v_shard TINYINT DEFAULT CatalogStatsShard();
+    UPDATE UserRatingStats s
+    JOIN (SELECT user_id, COUNT(*) AS removed FROM Ratings WHERE movie_id = OLD.movie_id GROUP BY user_id) r
+        ON r.user_id = s.user_id
+    SET s.rating_count = s.rating_count - r.removed;
+    UPDATE CatalogStats
+    SET movie_count = movie_count - 1,
+        rating_count = rating_count - (SELECT COUNT(*) FROM Ratings WHERE movie_id = OLD.movie_id),
+        imdb_rating_sum = imdb_rating_sum - IFNULL(OLD.imdb_rating, 0),
+        imdb_rating_count = imdb_rating_count - (OLD.imdb_rating IS NOT NULL)
+    WHERE stat_id = v_shard;
+END //
+
+-- Same for a user's ratings; their UserRatingStats row cascades with them.
+DROP TRIGGER IF EXISTS BeforeUserDeleteStats //
+CREATE TRIGGER BeforeUserDeleteStats
+BEFORE DELETE ON Users
+FOR EACH ROW
+BEGIN
+    DECLARE v_shard TINYINT DEFAULT CatalogStatsShard();
+    UPDATE CatalogStats
+    SET rating_count = rating_count - (SELECT COUNT(*) FROM Ratings WHERE user_id = OLD.user_id)
+    WHERE stat_id = v_shard;
+END //
+
+DROP TRIGGER IF EXISTS AfterRatingInsertStats //
+CREATE TRIGGER AfterRatingInsertStats
+AFTER INSERT ON Ratings
+FOR EACH ROW
+BEGIN
+    DECLARE v_shard TINYINT DEFAULT CatalogStatsShard();
+    UPDATE CatalogStats SET rating_count = rating_count + 1 WHERE stat_id = v_shard;
+    INSERT INTO UserRatingStats (user_id, rating_count) VALUES (NEW.user_id, 1)
+    ON DUPLICATE KEY UPDATE rating_count = rating_count + 1;
+END //
+
+DROP TRIGGER IF EXISTS AfterRatingUpdateStats //
+CREATE TRIGGER AfterRatingUpdateStats
+AFTER UPDATE ON Ratings
+FOR EACH ROW
+BEGIN
+    IF NEW.user_id <> OLD.user_id THEN
+        UPDATE UserRatingStats SET rating_count = rating_count - 1 WHERE user_id = OLD.user_id;
+        INSERT INTO UserRatingStats (user_id, rating_count) VALUES (NEW.user_id, 1)
+        ON DUPLICATE KEY UPDATE rating_count = rating_count + 1;
+    END IF;
+END //
+
+DROP TRIGGER IF EXISTS AfterRatingDeleteStats //
+CREATE TRIGGER AfterRatingDeleteStats
+AFTER DELETE ON Ratings
+FOR EACH ROW
+BEGIN
+    DECLARE v_shard TINYINT DEFAULT CatalogStatsShard();
+    UPDATE CatalogStats SET rating_count = rating_count - 1 WHERE stat_id = v_shard;
+    UPDATE UserRatingStats SET rating_count = rating_count - 1 WHERE user_id = OLD.user_id;
+END //
+
+DELIMITER ;
+
+-- Seed the counters from whatever is already loaded.
+CALL RefreshCatalogStats();
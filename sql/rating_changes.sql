@@ -0,0 +1,84 @@
+-- Append-only change feed of Ratings for BollywoodLens
+-- Run this AFTER bollywoodlens_schema.sql (safe to re-run).
+
+USE BollywoodLens;
+
+-- One row per rating insert, re-rate or delete (rating NULL), in commit order
+-- per (user, movie). The app's item-item model replays rows past the last
+-- change_id it applied, and MAX(change_id) is the ratings cache version: unlike
+-- COUNT(*) + MAX(rated_at) it moves for deletes and for re-rates that keep an
+-- older rated_at (bulk imports do).
+CREATE TABLE IF NOT EXISTS RatingChanges (
+    change_id BIGINT AUTO_INCREMENT PRIMARY KEY,
+    user_id INT NOT NULL,
+    movie_id INT NOT NULL,
+    rating DECIMAL(3,1) NULL,
+    changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    KEY idx_ratingchanges_changed_at (changed_at)
+);
+
+DELIMITER //
+
+DROP TRIGGER IF EXISTS AfterRatingInsertChange //
+CREATE TRIGGER AfterRatingInsertChange
+AFTER INSERT ON Ratings
+FOR EACH ROW
+BEGIN
+    INSERT INTO RatingChanges (user_id, movie_id, rating) VALUES (NEW.user_id, NEW.movie_id, NEW.rating);
+END //
+
+-- AddOrUpdateRating re-saving the same value only touches rated_at; skip those.
+DROP TRIGGER IF EXISTS AfterRatingUpdateChange //
+CREATE TRIGGER AfterRatingUpdateChange
+AFTER UPDATE ON Ratings
+FOR EACH ROW
+BEGIN
+    IF NEW.user_id <> OLD.user_id OR NEW.movie_id <> OLD.movie_id THEN
+        INSERT INTO RatingChanges (user_id, movie_id, rating) VALUES (OLD.user_id, OLD.movie_id, NULL);
+        INSERT INTO RatingChanges (user_id, movie_id, rating) VALUES (NEW.user_id, NEW.movie_id, NEW.rating);
+    ELSEIF NEW.rating <> OLD.rating THEN
+        INSERT INTO RatingChanges (user_id, movie_id, rating) VALUES (NEW.user_id, NEW.movie_id, NEW.rating);
+    END IF;
+END //
+
+DROP TRIGGER IF EXISTS AfterRatingDeleteChange //
+CREATE TRIGGER AfterRatingDeleteChange
+AFTER DELETE ON Ratings
+FOR EACH ROW
+BEGIN
+    INSERT INTO RatingChanges (user_id, movie_id, rating) VALUES (OLD.user_id, OLD.movie_id, NULL);
+END //
+
+-- Foreign-key cascades do not fire the Ratings triggers, so log the ratings a
+-- movie or user deletion is about to take with it.
+DROP TRIGGER IF EXISTS BeforeMovieDeleteChange //
+CREATE TRIGGER BeforeMovieDeleteChange
+BEFORE DELETE ON Movies
+FOR EACH ROW
+BEGIN
+    INSERT INTO RatingChanges (user_id, movie_id, rating)
+    SELECT user_id, movie_id, NULL FROM Ratings WHERE movie_id = OLD.movie_id;
+END //
+
+DROP TRIGGER IF EXISTS BeforeUserDeleteChange //
+CREATE TRIGGER BeforeUserDeleteChange
+BEFORE DELETE ON Users
+FOR EACH ROW
+BEGIN
+    INSERT INTO RatingChanges (user_id, movie_id, rating)
+    SELECT user_id, movie_id, NULL FROM Ratings WHERE user_id = OLD.user_id;
+END //
+
+-- Keep a day of history (a reader that falls further behind reloads from
+-- Ratings) but never the newest row, so MAX(change_id) stays meaningful.
+DROP EVENT IF EXISTS PruneRatingChanges //
+CREATE EVENT PruneRatingChanges
+ON SCHEDULE EVERY 1 HOUR
+DO
+BEGIN
+    SET @newest_change = (SELECT MAX(change_id) FROM RatingChanges);
+    DELETE FROM RatingChanges
+    WHERE changed_at < NOW() - INTERVAL 1 DAY AND change_id < @newest_change;
+END //
+
+DELIMITER ;
@@ -0,0 +1,123 @@
+-- Trigger-maintained per-user genre taste profiles for BollywoodLens
+-- Run this AFTER bollywoodlens_schema.sql (safe to re-run; it rebuilds the profiles).
+
+USE BollywoodLens;
+
+-- One row per (user, genre) the user has rated: how many of their ratings touch
+-- the genre and the sum of those ratings. "Tailored For You" reads a user's
+-- rows with one primary-key range scan instead of joining every rating to
+-- Movies, so a visit costs the same for 10 ratings or 10,000.
+CREATE TABLE IF NOT EXISTS UserGenreProfile (
+    user_id INT NOT NULL,
+    genre_id INT NOT NULL,
+    rating_count INT NOT NULL DEFAULT 0,
+    rating_sum DECIMAL(12,1) NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, genre_id),
+    CONSTRAINT fk_usergenreprofile_user FOREIGN KEY (user_id)
+        REFERENCES Users(user_id) ON DELETE CASCADE,
+    CONSTRAINT fk_usergenreprofile_genre FOREIGN KEY (genre_id)
+        REFERENCES Genres(genre_id) ON DELETE CASCADE
+);
+
+DELIMITER //
+
+-- Recompute every profile from Ratings x MovieGenres (initial fill or drift repair).
+DROP PROCEDURE IF EXISTS RefreshUserGenreProfile //
+CREATE PROCEDURE RefreshUserGenreProfile()
+BEGIN
+    START TRANSACTION;
+    DELETE FROM UserGenreProfile;
+    INSERT INTO UserGenreProfile (user_id, genre_id, rating_count, rating_sum)
+    SELECT r.user_id, mg.genre_id, COUNT(*), SUM(r.rating)
+    FROM Ratings r
+    JOIN MovieGenres mg ON mg.movie_id = r.movie_id
+    GROUP BY r.user_id, mg.genre_id;
+    COMMIT;
+END //
+
+DROP TRIGGER IF EXISTS AfterRatingInsertProfile //
+CREATE TRIGGER AfterRatingInsertProfile
+AFTER INSERT ON Ratings
+FOR EACH ROW
+BEGIN
+    INSERT INTO UserGenreProfile (user_id, genre_id, rating_count, rating_sum)
+    SELECT NEW.user_id, genre_id, 1, NEW.rating FROM MovieGenres WHERE movie_id = NEW.movie_id
+    ON DUPLICATE KEY UPDATE rating_count = rating_count + 1, rating_sum = rating_sum + NEW.rating;
+END //
+
+-- AddOrUpdateRating re-rates through ON DUPLICATE KEY UPDATE, which lands here.
+DROP TRIGGER IF EXISTS AfterRatingUpdateProfile //
+CREATE TRIGGER AfterRatingUpdateProfile
+AFTER UPDATE ON Ratings
+FOR EACH ROW
+BEGIN
+    IF NEW.user_id = OLD.user_id AND NEW.movie_id = OLD.movie_id THEN
+        IF NEW.rating <> OLD.rating THEN
+            UPDATE UserGenreProfile p
+            JOIN MovieGenres mg ON mg.genre_id = p.genre_id AND mg.movie_id = NEW.movie_id
+            SET p.rating_sum = p.rating_sum + NEW.rating - OLD.rating
+            WHERE p.user_id = NEW.user_id;
+        END IF;
+    ELSE
+        UPDATE UserGenreProfile p
+        JOIN MovieGenres mg ON mg.genre_id = p.genre_id AND mg.movie_id = OLD.movie_id
+        SET p.rating_count = p.rating_count - 1, p.rating_sum = p.rating_sum - OLD.rating
+        WHERE p.user_id = OLD.user_id;
+        INSERT INTO UserGenreProfile (user_id, genre_id, rating_count, rating_sum)
+        SELECT NEW.user_id, genre_id, 1, NEW.rating FROM MovieGenres WHERE movie_id = NEW.movie_id
+        ON DUPLICATE KEY UPDATE rating_count = rating_count + 1, rating_sum = rating_sum + NEW.rating;
+    END IF;
+END //
+
+DROP TRIGGER IF EXISTS AfterRatingDeleteProfile //
+CREATE TRIGGER AfterRatingDeleteProfile
+AFTER DELETE ON Ratings
+FOR EACH ROW
+BEGIN
+    UPDATE UserGenreProfile p
+    JOIN MovieGenres mg ON mg.genre_id = p.genre_id AND mg.movie_id = OLD.movie_id
+    SET p.rating_count = p.rating_count - 1, p.rating_sum = p.rating_sum - OLD.rating
+    WHERE p.user_id = OLD.user_id;
+END //
+
+-- Re-tagging a movie moves every existing rating of it with its tags. Each tag
+-- row walks the movie's ratings, so the loader only inserts and deletes the
+-- (movie, genre) pairs that actually changed.
+DROP TRIGGER IF EXISTS AfterMovieGenreInsertProfile //
+CREATE TRIGGER AfterMovieGenreInsertProfile
+AFTER INSERT ON MovieGenres
+FOR EACH ROW
+BEGIN
+    INSERT INTO UserGenreProfile (user_id, genre_id, rating_count, rating_sum)
+    SELECT user_id, NEW.genre_id, 1, rating FROM Ratings WHERE movie_id = NEW.movie_id
+    ON DUPLICATE KEY UPDATE rating_count = rating_count + 1, rating_sum = rating_sum + VALUES(rating_sum);
+END //
+
+DROP TRIGGER IF EXISTS AfterMovieGenreDeleteProfile //
+CREATE TRIGGER AfterMovieGenreDeleteProfile
+AFTER DELETE ON MovieGenres
+FOR EACH ROW
+BEGIN
+    UPDATE UserGenreProfile p
+    JOIN Ratings r ON r.user_id = p.user_id AND r.movie_id = OLD.movie_id
+    SET p.rating_count = p.rating_count - 1, p.rating_sum = p.rating_sum - r.rating
+    WHERE p.genre_id = OLD.genre_id;
+END //
+
+-- Deleting a movie cascades to its Ratings and MovieGenres without firing
+-- their triggers, so take its ratings out of every tagged genre here.
+DROP TRIGGER IF EXISTS BeforeMovieDeleteProfile //
+CREATE TRIGGER BeforeMovieDeleteProfile
+BEFORE DELETE ON Movies
+FOR EACH ROW
+BEGIN
+    UPDATE UserGenreProfile p
+    JOIN Ratings r ON r.user_id = p.user_id AND r.movie_id = OLD.movie_id
+    JOIN MovieGenres mg ON mg.genre_id = p.genre_id AND mg.movie_id = OLD.movie_id
+    SET p.rating_count = p.rating_count - 1, p.rating_sum = p.rating_sum - r.rating;
+END //
+
+DELIMITER ;
+
+-- Seed the profiles from whatever is already rated.
+CALL RefreshUserGenreProfile();
@@ -0,0 +1,42 @@
+"""Shared fixtures for the BollywoodLens tests.
+
+Pure-Python tests run anywhere. Tests that need the MySQL triggers and
+procedures take the ``mysql_engine`` fixture and are skipped unless
+``BOLLYWOODLENS_TEST_DB_URL`` points at a scratch database provisioned with
+the scripts in ``sql/`` (they insert and then delete their own rows).
+"""
+from __future__ import annotations
+
+import logging
+import os
+import pathlib
+import sys
+
+import pytest
+from sqlalchemy import create_engine
+
+ROOT = pathlib.Path(__file__).resolve().parents[1]
+sys.path[:0] = [str(ROOT / "app"), str(ROOT / "scripts")]
+
+TEST_DB_URL = os.getenv("BOLLYWOODLENS_TEST_DB_URL")
+
+
+@pytest.fixture(scope="session")
+def mysql_engine():
+    if not TEST_DB_URL:
+        pytest.skip("BOLLYWOODLENS_TEST_DB_URL is not set")
+    engine = create_engine(TEST_DB_URL, pool_size=4)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def app_module(tmp_path_factory):
+    """The Streamlit app imported in bare mode against an empty SQLite file."""
+    db_path = tmp_path_factory.mktemp("app") / "bollywoodlens.db"
+    os.environ.setdefault("BOLLYWOODLENS_DB_URL", f"sqlite:///{db_path}")
+    os.environ.setdefault("BOLLYWOODLENS_RATING_WRITE_BEHIND", "false")
+    logging.disable(logging.WARNING)
+    import streamlit_app
+
+    return streamlit_app
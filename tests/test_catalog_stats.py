@@ -0,0 +1,68 @@
+"""Concurrency checks for the sharded CatalogStats counters (sql/catalog_stats.sql)."""
+from __future__ import annotations
+
+import uuid
+
+from sqlalchemy import text
+
+
+def _connection_on_other_shard(engine, taken: int):
+    """A connection whose CatalogStatsShard() differs from ``taken``."""
+    spare = []
+    try:
+        for _ in range(32):
+            conn = engine.connect()
+            if conn.execute(text("SELECT CatalogStatsShard()")).scalar() != taken:
+                return conn
+            spare.append(conn)
+        raise AssertionError("every new connection landed on the same CatalogStats shard")
+    finally:
+        for conn in spare:
+            conn.close()
+
+
+def _insert_movie(conn, imdb_id: str) -> int:
+    conn.execute(
+        text("INSERT INTO Movies (imdb_id, title, genre, imdb_rating) VALUES (:imdb_id, 'Shard test', 'Drama', 7.0)"),
+        {"imdb_id": imdb_id},
+    )
+    return conn.execute(text("SELECT movie_id FROM Movies WHERE imdb_id = :imdb_id"), {"imdb_id": imdb_id}).scalar()
+
+
+def test_concurrent_writers_do_not_block_on_counters(mysql_engine):
+    prefix = "zz" + uuid.uuid4().hex[:8]
+    first = mysql_engine.connect()
+    first_shard = first.execute(text("SELECT CatalogStatsShard()")).scalar()
+    second = _connection_on_other_shard(mysql_engine, first_shard)
+    try:
+        second.execute(text("SET SESSION innodb_lock_wait_timeout = 2"))
+        user_id = second.execute(text("SELECT MIN(user_id) FROM Users")).scalar()
+
+        # The first writer holds its shard row locked in an open transaction...
+        _insert_movie(first, f"{prefix}a")
+        # ...while the second inserts a movie and a rating; with a single counter
+        # row this would wait on the first transaction and time out.
+        movie_id = _insert_movie(second, f"{prefix}b")
+        second.execute(
+            text("INSERT INTO Ratings (user_id, movie_id, rating) VALUES (:user_id, :movie_id, 8.0)"),
+            {"user_id": user_id, "movie_id": movie_id},
+        )
+        second.commit()
+        first.commit()
+
+        with mysql_engine.connect() as conn:
+            totals = conn.execute(
+                text("SELECT SUM(movie_count), SUM(rating_count), SUM(imdb_rating_count) FROM CatalogStats")
+            ).one()
+            actual = conn.execute(
+                text("""SELECT (SELECT COUNT(*) FROM Movies), (SELECT COUNT(*) FROM Ratings),
+                               (SELECT COUNT(imdb_rating) FROM Movies)""")
+            ).one()
+        assert tuple(totals) == tuple(actual)
+    finally:
+        first.rollback()
+        second.rollback()
+        first.close()
+        second.close()
+        with mysql_engine.begin() as conn:
+            conn.execute(text("DELETE FROM Movies WHERE imdb_id LIKE :prefix"), {"prefix": f"{prefix}%"})
@@ -0,0 +1,21 @@
+"""Transactions on the per-rerun shared connection (app/streamlit_app.py)."""
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import text
+
+
+def test_shared_connection_is_idle_between_helpers(app_module):
+    with app_module.render_connection() as shared:
+        with app_module.db_connection() as conn:
+            assert conn is shared
+            conn.execute(text("SELECT 1")).scalar()
+        assert not shared.in_transaction()
+
+        with pytest.raises(ZeroDivisionError):
+            with app_module.db_connection() as conn:
+                conn.execute(text("SELECT 1")).scalar()
+                1 / 0
+        assert not shared.in_transaction()
+        with app_module.db_connection() as conn:
+            assert conn.execute(text("SELECT 2")).scalar() == 2
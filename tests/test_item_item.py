@@ -0,0 +1,93 @@
+"""Replaying the RatingChanges feed into the item-item model (app/streamlit_app.py).
+
+SQLite stands in for MySQL here; its triggers mirror sql/rating_changes.sql.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from sqlalchemy import text
+
+SCHEMA = [
+    "CREATE TABLE Ratings (user_id INT, movie_id INT, rating REAL, rated_at TEXT, PRIMARY KEY (user_id, movie_id))",
+    """CREATE TABLE RatingChanges (
+        change_id INTEGER PRIMARY KEY AUTOINCREMENT, user_id INT, movie_id INT, rating REAL,
+        changed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)""",
+    """CREATE TRIGGER AfterRatingInsertChange AFTER INSERT ON Ratings BEGIN
+        INSERT INTO RatingChanges (user_id, movie_id, rating) VALUES (NEW.user_id, NEW.movie_id, NEW.rating); END""",
+    """CREATE TRIGGER AfterRatingUpdateChange AFTER UPDATE ON Ratings WHEN NEW.rating <> OLD.rating BEGIN
+        INSERT INTO RatingChanges (user_id, movie_id, rating) VALUES (NEW.user_id, NEW.movie_id, NEW.rating); END""",
+    """CREATE TRIGGER AfterRatingDeleteChange AFTER DELETE ON Ratings BEGIN
+        INSERT INTO RatingChanges (user_id, movie_id, rating) VALUES (OLD.user_id, OLD.movie_id, NULL); END""",
+]
+
+
+@pytest.fixture
+def ratings_db(app_module):
+    with app_module.engine.begin() as conn:
+        for statement in SCHEMA:
+            conn.execute(text(statement))
+        rng = np.random.default_rng(7)
+        rows = {(int(user), int(movie)): float(rng.integers(1, 11))
+                for user, movie in zip(rng.integers(1, 40, 600), rng.integers(1, 60, 600))}
+        conn.execute(
+            text("INSERT INTO Ratings VALUES (:user_id, :movie_id, :rating, '2020-01-01')"),
+            [{"user_id": user, "movie_id": movie, "rating": rating} for (user, movie), rating in rows.items()],
+        )
+    yield app_module.engine
+    with app_module.engine.begin() as conn:
+        for name in ("Ratings", "RatingChanges"):
+            conn.execute(text(f"DROP TABLE {name}"))
+
+
+def _fresh_model(app_module):
+    model = app_module.ItemItemModel()
+    model.sync("reference")
+    return model
+
+
+def _assert_same(model, reference):
+    shape = tuple(max(a, b) for a, b in zip(model._centred.shape, reference._centred.shape))
+    model._centred.resize(shape)
+    reference._centred.resize(shape)
+    assert abs(model._centred - reference._centred).max() < 1e-5
+    assert model.rating_count == reference.rating_count
+
+
+def test_feed_replays_old_timestamp_updates_and_delete_insert_pairs(app_module, ratings_db):
+    model = app_module.ItemItemModel()
+    model.sync("v1")
+    with ratings_db.begin() as conn:
+        # A re-rate that keeps its old rated_at, and a delete + insert that keeps COUNT(*).
+        conn.execute(text("UPDATE Ratings SET rating = 11 - rating WHERE user_id = 5"))
+        victim = conn.execute(text("SELECT user_id, movie_id FROM Ratings LIMIT 1")).one()
+        conn.execute(text("DELETE FROM Ratings WHERE user_id = :u AND movie_id = :m"), {"u": victim[0], "m": victim[1]})
+        conn.execute(text("INSERT OR IGNORE INTO Ratings VALUES (3, 99, 4, '2000-01-01')"))
+    model.sync("v2")
+
+    assert model.reloads == 1
+    assert model._pending
+    with model._lock:
+        model._merge()
+    _assert_same(model, _fresh_model(app_module))
+    assert model.recommend(5, 10).equals(_fresh_model(app_module).recommend(5, 10))
+
+
+def test_ids_missing_from_the_feed_are_read_again(app_module, ratings_db):
+    model = app_module.ItemItemModel()
+    model.sync("v1")
+    start = model.change_id
+    with ratings_db.begin() as conn:
+        # Simulate an earlier transaction that has taken change_id start + 1 but not committed yet.
+        conn.execute(text("INSERT INTO RatingChanges (change_id, user_id, movie_id, rating) "
+                          "VALUES (:id, 0, 0, NULL)"), {"id": start + 2})
+    model.sync("v2")
+    assert start + 1 in model._holes
+
+    with ratings_db.begin() as conn:
+        conn.execute(text("INSERT INTO Ratings VALUES (7, 123, 9, '2020-01-01')"))
+        conn.execute(text("UPDATE RatingChanges SET change_id = :id WHERE change_id = "
+                          "(SELECT MAX(change_id) FROM RatingChanges)"), {"id": start + 1})
+    model.sync("v3")
+    assert start + 1 not in model._holes
+    assert model._pending[7][123] == 9.0
@@ -0,0 +1,34 @@
+"""Delta bookkeeping of the movie loader (scripts/load_movies.py)."""
+from __future__ import annotations
+
+import pandas as pd
+
+import load_movies
+
+
+def _chunk(rows):
+    return pd.DataFrame(rows, columns=["imdb_id", "content_hash"])
+
+
+def test_delta_counts_new_changed_unchanged_and_deleted():
+    stored = pd.Series([1, 2, 3], index=["tt1", "tt2", "tt3"])
+    counts = load_movies.DeltaCounts()
+    chunks = [_chunk([("tt1", 1), ("tt2", 20)]), _chunk([("tt4", 4)])]
+    pending = pd.concat(load_movies._delta_chunks(chunks, stored, counts))
+    assert pending["imdb_id"].tolist() == ["tt2", "tt4"]
+    assert (counts.new, counts.changed, counts.unchanged, counts.deleted) == (1, 1, 1, 1)
+
+
+def test_rows_skipped_by_resume_are_not_counted_as_deleted():
+    stored = pd.Series([1, 2, 3], index=["tt1", "tt2", "tt3"])
+    counts = load_movies.DeltaCounts()
+    skipped_ids: set[str] = set()
+
+    def resumed_chunks():
+        # The journal already covers tt1 and tt2; only tt3 reaches the delta step.
+        skipped_ids.update(["tt1", "tt2"])
+        yield _chunk([("tt3", 3)])
+
+    list(load_movies._delta_chunks(resumed_chunks(), stored, counts, skipped_ids))
+    assert counts.unchanged == 1
+    assert counts.deleted == 0
@@ -0,0 +1,75 @@
+"""Ordering rules of the bulk ratings import (scripts/load_ratings.py)."""
+from __future__ import annotations
+
+import uuid
+
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.dialects import mysql
+
+import load_ratings
+
+
+def _batch(rows):
+    return pd.DataFrame(rows, columns=["user_id", "movie_id", "rating", "rated_at"]).assign(
+        rated_at=lambda frame: pd.to_datetime(frame["rated_at"])
+    )
+
+
+def test_newest_event_per_pair_wins_within_a_batch():
+    batch = _batch([(1, 5, 9.0, "2024-01-01"), (1, 5, 3.0, "2020-01-01"), (2, 5, 1.0, "2021-01-01")])
+    (rows, statement), = load_ratings._batch_statements(batch)
+    params = statement.compile(dialect=mysql.dialect()).params
+    assert rows == 2
+    assert sorted(value for key, value in params.items() if key.startswith("rating_")) == [1.0, 9.0]
+
+
+def test_timestamped_upsert_decides_rating_before_moving_rated_at():
+    batch = _batch([(1, 5, 9.0, "2024-01-01")])
+    (_, statement), = load_ratings._batch_statements(batch)
+    sql = str(statement.compile(dialect=mysql.dialect()))
+    update = sql.split("ON DUPLICATE KEY UPDATE", 1)[1]
+    assert update.index("rating = IF(") < update.index("rated_at = GREATEST(")
+
+
+def test_older_event_does_not_overwrite_newer_rating(mysql_engine, tmp_path):
+    imdb_id = "zz" + uuid.uuid4().hex[:8]
+    with mysql_engine.begin() as conn:
+        conn.execute(text("INSERT INTO Movies (imdb_id, title) VALUES (:imdb_id, 'Import test')"), {"imdb_id": imdb_id})
+        movie_id = conn.execute(text("SELECT movie_id FROM Movies WHERE imdb_id = :imdb_id"), {"imdb_id": imdb_id}).scalar()
+        user_id = conn.execute(text("SELECT MIN(user_id) FROM Users")).scalar()
+        conn.execute(
+            text("INSERT INTO Ratings (user_id, movie_id, rating, rated_at) VALUES (:user_id, :movie_id, 8.0, '2024-06-01')"),
+            {"user_id": user_id, "movie_id": movie_id},
+        )
+    try:
+        events = tmp_path / "events.csv"
+        events.write_text(
+            "user_id,movie_id,rating,rated_at\n"
+            f"{user_id},{movie_id},2.0,2023-01-01 00:00:00\n",
+            encoding="utf-8",
+        )
+        load_ratings.load_ratings(events, mysql_engine.url.render_as_string(hide_password=False))
+        with mysql_engine.connect() as conn:
+            rating, rated_at = conn.execute(
+                text("SELECT rating, rated_at FROM Ratings WHERE user_id = :user_id AND movie_id = :movie_id"),
+                {"user_id": user_id, "movie_id": movie_id},
+            ).one()
+        assert float(rating) == 8.0
+        assert rated_at == pd.Timestamp("2024-06-01")
+
+        events.write_text(
+            "user_id,movie_id,rating,rated_at\n"
+            f"{user_id},{movie_id},6.5,2025-01-01 00:00:00\n",
+            encoding="utf-8",
+        )
+        load_ratings.load_ratings(events, mysql_engine.url.render_as_string(hide_password=False))
+        with mysql_engine.connect() as conn:
+            rating = conn.execute(
+                text("SELECT rating FROM Ratings WHERE user_id = :user_id AND movie_id = :movie_id"),
+                {"user_id": user_id, "movie_id": movie_id},
+            ).scalar()
+        assert float(rating) == 6.5
+    finally:
+        with mysql_engine.begin() as conn:
+            conn.execute(text("DELETE FROM Movies WHERE imdb_id = :imdb_id"), {"imdb_id": imdb_id})
@@ -0,0 +1,34 @@
+"""Which SQL Playground queries may be served from the shared result cache."""
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.mark.parametrize("query", [
+    "SELECT title FROM Movies ORDER BY imdb_rating DESC LIMIT 10;",
+    "select m.title, r.rating from Movies m join Ratings r on r.movie_id = m.movie_id",
+    "SELECT * FROM `BollywoodLens`.`Movies`",
+    "WITH top AS (SELECT * FROM Movies) SELECT * FROM top",
+    "SELECT 'from Users' FROM Movies",
+    "SELECT * FROM Movies LEFT JOIN Ratings USING (movie_id)",
+])
+def test_queries_over_probed_tables_are_cached(app_module, query):
+    assert app_module.is_cacheable_sql(query)
+
+
+@pytest.mark.parametrize("query", [
+    "SELECT name FROM Users",
+    "SELECT * FROM Movies m, Users u WHERE m.movie_id = u.user_id",
+    "SELECT * FROM Movies WHERE movie_id IN (SELECT movie_id FROM MovieGenres)",
+    "SELECT * FROM (SELECT * FROM Ratings) r JOIN CatalogStats c",
+    "SELECT * FROM UserGenreProfile",
+    "SELECT * FROM Movies STRAIGHT_JOIN Users",
+    "SELECT * FROM Movies JOIN Users ON Users.user_id = Movies.movie_id",
+    "SELECT * FROM Movies NATURAL JOIN MovieSimilarity",
+    "SELECT * FROM TopRatedMovies",
+    "SELECT NOW() FROM Movies",
+    "CALL GetMoviesByGenre('Drama')",
+    "SHOW TABLES",
+])
+def test_other_queries_bypass_the_cache(app_module, query):
+    assert not app_module.is_cacheable_sql(query)
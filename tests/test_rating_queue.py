@@ -0,0 +1,85 @@
+"""Failure handling of the write-behind rating queue (app/streamlit_app.py)."""
+from __future__ import annotations
+
+import json
+import time
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+
+class _Orig(Exception):
+    pass
+
+
+def _wait_for(condition, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached")
+        time.sleep(0.02)
+
+
+@pytest.fixture
+def make_queue(app_module, tmp_path):
+    queues = []
+
+    def make(write):
+        class StubQueue(app_module.RatingWriteQueue):
+            def _write(self, rows):
+                write(rows)
+
+        queue = StubQueue(None, 0.05, 100, str(tmp_path / "spool.jsonl"))
+        queues.append(queue)
+        return queue
+
+    yield make
+    for queue in queues:
+        queue.close(1)
+
+
+def test_only_database_connection_and_lock_errors_are_transient(app_module):
+    assert app_module._is_transient_db_error(OperationalError("x", {}, _Orig(1213, "deadlock")))
+    assert app_module._is_transient_db_error(OperationalError("x", {}, _Orig(2013, "lost connection")))
+    assert not app_module._is_transient_db_error(OperationalError("x", {}, _Orig(1452, "foreign key")))
+    assert not app_module._is_transient_db_error(KeyError("bug"))
+
+
+def test_spooled_ratings_stay_pending_until_written(make_queue):
+    state = {"down": True, "written": []}
+
+    def write(rows):
+        if state["down"]:
+            raise OperationalError("x", {}, _Orig(2013, "lost connection"))
+        state["written"].append(dict(rows))
+
+    queue = make_queue(write)
+    queue.submit(4, 1, 8)
+    _wait_for(lambda: queue.stats()["spooled_rows"] == 1)
+    queue.submit(4, 2, 3)
+    assert queue.pending_for(4) == {1: 8.0, 2: 3.0}
+
+    state["down"] = False
+    _wait_for(lambda: state["written"])
+    assert state["written"] == [{(4, 1): 8.0, (4, 2): 3.0}]
+    assert queue.pending_for(4) == {}
+
+
+def test_unexpected_errors_are_rejected_and_the_flusher_survives(make_queue):
+    state = {"broken": True, "written": []}
+
+    def write(rows):
+        if state["broken"]:
+            raise KeyError("bug")
+        state["written"].append(dict(rows))
+
+    queue = make_queue(write)
+    queue.submit(6, 1, 2)
+    _wait_for(lambda: queue.stats()["rejected_rows"] == 1)
+    with open(queue.spool_path + ".rejected", encoding="utf-8") as handle:
+        assert json.loads(handle.readline())["movie_id"] == 1
+
+    state["broken"] = False
+    queue.submit(7, 1, 5)
+    _wait_for(lambda: state["written"])
+    assert state["written"] == [{(7, 1): 5.0}]
@@ -0,0 +1,40 @@
+"""FULLTEXT expression building for the search page."""
+from __future__ import annotations
+
+
+def test_stopwords_are_left_out_of_match(app_module):
+    expression, dropped_words = app_module._fulltext_terms("The Lunchbox")
+    assert expression == "+Lunchbox*"
+    assert dropped_words
+
+
+def test_stopword_title_keeps_like_post_filter(app_module):
+    clauses, params, relevance = [], {}, []
+    app_module._add_text_search("title", "The Lunchbox", clauses, params, relevance)
+    assert params["title_ft"] == "+Lunchbox*"
+    assert params["title_like"] == "%The Lunchbox%"
+    assert len(clauses) == 2
+
+
+def test_only_stopwords_and_short_words_fall_back_to_like(app_module):
+    expression, dropped_words = app_module._fulltext_terms("Who Am I")
+    assert expression is None
+    assert dropped_words
+
+
+def test_indexable_words_need_no_post_filter(app_module):
+    expression, dropped_words = app_module._fulltext_terms("Lagaan Aamir")
+    assert expression == "+Lagaan* +Aamir*"
+    assert not dropped_words
+
+
+def test_relevance_cursor_seeks_on_rounded_score_then_movie_id(app_module):
+    query, params, cursor_columns = app_module.build_movie_search_query(
+        cursor=(1.2345, 7.5, 42), title="Lagaan"
+    )
+    rounded = "ROUND(MATCH(title) AGAINST (:title_ft IN BOOLEAN MODE), 4)"
+    assert cursor_columns == ["relevance", "imdb_rating", "movie_id"]
+    assert f"{rounded} < :cursor_0" in query
+    assert f"{rounded} = :cursor_0" in query
+    assert f"ORDER BY {rounded} DESC, imdb_rating DESC, movie_id DESC" in query
+    assert params["cursor_0"] == 1.2345